@@ -0,0 +1,218 @@
+import asyncio
+import os
+import logging
+from contextlib import AsyncExitStack
+from aiobotocore.session import get_session
+from botocore.exceptions import ClientError
+from botocore.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Same retry policy as the synchronous wrapper, kept here so this module doesn't require boto3
+_RETRIES = {
+    'max_attempts': 5,
+    'mode': 'adaptive'
+}
+
+class AsyncDOSpacesWrapper:
+    def __init__(self):
+        """
+        Initializes the AsyncDOSpacesWrapper object with the necessary configurations for interacting with DigitalOcean Spaces.
+
+        The client is only created when entering the wrapper with `async with`.
+        """
+        self.client = None
+        self.bucket_name = os.getenv('DO_SPACES_BUCKET_NAME')
+        self._exit_stack = None
+
+    async def __aenter__(self):
+        """
+        Opens the aiobotocore client and its connection pool.
+        """
+        self._exit_stack = AsyncExitStack()
+        session = get_session()
+        self.client = await self._exit_stack.enter_async_context(session.create_client(
+            's3',
+            region_name=os.getenv('DO_SPACES_REGION'),
+            endpoint_url=f"https://nyc3.digitaloceanspaces.com",
+            aws_access_key_id=os.getenv('DO_SPACES_KEY_ID'),
+            aws_secret_access_key=os.getenv('DO_SPACES_SECRET_KEY'),
+            config=Config(
+                s3={'addressing_style': 'virtual'},
+                max_pool_connections=64,
+                retries=_RETRIES,
+            ),
+        ))
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Closes the aiobotocore client and releases its connections.
+        """
+        await self._exit_stack.aclose()
+        self.client = None
+        self._exit_stack = None
+
+    async def fileExists(self, filePath):
+        """
+        Checks if a file exists within the DigitalOcean Spaces bucket.
+
+        Args:
+            filePath (str): The path of the file to check.
+
+        Returns:
+            bool: True if the file exists, False otherwise.
+        """
+        try:
+            await self.client.head_object(Bucket=self.bucket_name, Key=filePath)
+            return True
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code == '404':
+                return False
+            else:
+                logger.exception("An error occurred while checking file existence")
+                return False
+
+    async def uploadFile(self, filePath, fileData):
+        """
+        Uploads a file to the DigitalOcean Spaces bucket.
+
+        Args:
+            filePath (str): The path where the file should be uploaded.
+            fileData (bytes or file-like object): The file data to be uploaded.
+        """
+        try:
+            await self.client.put_object(Bucket=self.bucket_name, Key=filePath, Body=fileData)
+            logger.debug("Successfully uploaded file: %s", filePath)
+        except ClientError:
+            logger.exception("An error occurred while uploading the file")
+
+    async def deleteFile(self, filePath):
+        """
+        Deletes a file from the DigitalOcean Spaces bucket.
+
+        Args:
+            filePath (str): The path of the file to be deleted.
+        """
+        try:
+            await self.client.delete_object(Bucket=self.bucket_name, Key=filePath)
+            logger.debug("Successfully deleted file: %s", filePath)
+        except ClientError:
+            logger.exception("An error occurred while deleting the file")
+
+    async def listFolderContents(self, folderPath):
+        """
+        Lists the contents (files and folders) within a specific folder in the DigitalOcean Spaces bucket.
+
+        Args:
+            folderPath (str): The path of the folder to list contents for.
+
+        Returns:
+            list: A list of file and folder paths within the specified folder.
+        """
+        logger.debug("Listing folder contents of %s", folderPath)
+
+        marker = folderPath + '/'
+
+        try:
+            paginator = self.client.get_paginator('list_objects_v2')
+            operation_parameters = {'Bucket': self.bucket_name, 'Prefix': marker, 'Delimiter': '/', 'PaginationConfig': {'PageSize': 1000}}
+
+            # The listing doubles as the existence check, so no separate HEAD is needed
+            saw_any = False
+            contents = []
+            async for page in paginator.paginate(**operation_parameters):
+
+                if 'Contents' in page:
+                    saw_any = True
+                    for object in page['Contents']:
+                        key = object['Key']
+
+                        if key != marker:  # Exclude the folder path itself
+                            contents.append(key)
+
+                if 'CommonPrefixes' in page:
+                    saw_any = True
+                    for prefix in page['CommonPrefixes']:
+
+                        if prefix['Prefix'] != marker:   # Exclude the folder path itself
+                            contents.append(prefix['Prefix'])
+        except ClientError:
+            logger.exception("An error occurred while listing folder contents")
+            return []
+
+        if not saw_any:
+            raise Exception(f"Folder {folderPath} does not exist")
+
+        return contents
+
+    async def uploadFileChunked(self, filePath, fileData, chunkSize=8388608, maxInFlight=16):  # 8MB chunks
+        """
+        Uploads a file to the DigitalOcean Spaces bucket in chunks.
+
+        File-like objects are sent as a multipart upload with the parts uploaded concurrently; bytes and empty files go up in a single request.
+        Reads from fileData run in the default executor so a blocking file doesn't stall the event loop.
+        The multipart upload is aborted as soon as a part fails, or if anything else fails or the call is cancelled.
+
+        Args:
+            filePath (str): The path where the file should be uploaded.
+            fileData (bytes or file-like object): The file data to be uploaded.
+            chunkSize (int, optional): The size of each chunk in bytes. Defaults to 8388608 (8MB).
+            maxInFlight (int, optional): The maximum number of parts held in memory and uploading at once. Defaults to 16.
+        """
+        loop = asyncio.get_running_loop()
+
+        try:
+            chunk = await loop.run_in_executor(None, fileData.read, chunkSize) if hasattr(fileData, 'read') else None
+
+            if not chunk:  # If fileData is bytes or an empty file-like object
+                await self.client.put_object(Bucket=self.bucket_name, Key=filePath, Body=fileData if chunk is None else b'')
+            else:
+                upload_id = (await self.client.create_multipart_upload(Bucket=self.bucket_name, Key=filePath))['UploadId']
+                in_flight = asyncio.Semaphore(maxInFlight)
+                failures = []
+
+                async def upload_part(part_number, chunk):
+                    try:
+                        part = await self.client.upload_part(Body=chunk, Bucket=self.bucket_name, Key=filePath, PartNumber=part_number, UploadId=upload_id)
+                        return {'PartNumber': part_number, 'ETag': part['ETag']}
+                    except Exception as e:
+                        failures.append(e)
+                        raise
+                    finally:
+                        in_flight.release()
+
+                tasks = []
+                completed = False
+                try:
+                    part_number = 1
+                    while chunk:
+                        await in_flight.acquire()
+
+                        # Stop reading and abort as soon as any part has failed
+                        if failures:
+                            raise failures[0]
+
+                        tasks.append(asyncio.ensure_future(upload_part(part_number, chunk)))
+                        part_number += 1
+                        chunk = await loop.run_in_executor(None, fileData.read, chunkSize)
+
+                    parts = await asyncio.gather(*tasks)
+                    await self.client.complete_multipart_upload(Bucket=self.bucket_name, Key=filePath, MultipartUpload={'Parts': parts}, UploadId=upload_id)
+                    completed = True
+                finally:
+                    # Runs on any failure, including cancellation, so parts don't linger as billed storage
+                    if not completed:
+                        for task in tasks:
+                            task.cancel()
+                        # Let in-flight parts settle so none lands after the abort
+                        await asyncio.gather(*tasks, return_exceptions=True)
+                        try:
+                            await self.client.abort_multipart_upload(Bucket=self.bucket_name, Key=filePath, UploadId=upload_id)
+                        except ClientError:
+                            logger.exception("An error occurred while aborting the multipart upload")
+
+            logger.debug("Successfully uploaded file: %s", filePath)
+        except ClientError:
+            logger.exception("An error occurred while uploading the file")
@@ -1,23 +1,80 @@
+import io
 import os
+import functools
+import logging
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from operator import itemgetter
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from botocore.config import Config
 
+logger = logging.getLogger(__name__)
+
+# Shared pool for fanning out independent batch requests (e.g. delete_objects)
+_executor = ThreadPoolExecutor(max_workers=8)
+
+# delete_objects rejects requests with more keys than this
+_DELETE_BATCH_SIZE = 1000
+
+_get_key = itemgetter('Key')
+
+# System headers that a copy with MetadataDirective='REPLACE' would otherwise reset
+_PRESERVED_HEADERS = ('ContentType', 'ContentDisposition', 'ContentEncoding', 'ContentLanguage')
+
+# Adaptive mode adds client-side rate limiting on top of exponential backoff with jitter,
+# so throttled requests (503 SlowDown) back off before retrying
+_RETRIES = {
+    'max_attempts': 5,
+    'mode': 'adaptive'
+}
+
+@functools.lru_cache(maxsize=1)
+def _get_session():
+    """
+    Creates the boto3 session shared by every DOSpacesWrapper in the process.
+
+    Returns:
+        boto3.session.Session: The shared session the client is built from.
+    """
+    return boto3.session.Session()
+
+@functools.lru_cache(maxsize=1)
+def _get_client():
+    """
+    Creates the S3 client shared by every DOSpacesWrapper in the process.
+
+    Building a client resolves endpoints and credentials and sets up its connection pool, so it is done
+    once and reused, which also keeps HTTP connections alive between calls.
+
+    Returns:
+        botocore.client.S3: The shared DigitalOcean Spaces client.
+    """
+    return _get_session().client(
+        's3',
+        region_name=os.getenv('DO_SPACES_REGION'),
+        endpoint_url=f"https://nyc3.digitaloceanspaces.com",
+        aws_access_key_id=os.getenv('DO_SPACES_KEY_ID'),
+        aws_secret_access_key=os.getenv('DO_SPACES_SECRET_KEY'),
+        config=Config(
+            s3={'addressing_style': 'virtual'},
+            max_pool_connections=64,
+            retries=_RETRIES,
+            tcp_keepalive=True,
+        ),
+        # verify=False
+    )
+
 class DOSpacesWrapper:
     def __init__(self):
         """
         Initializes the DOSpacesWrapper object with the necessary configurations for interacting with DigitalOcean Spaces.
         """
-        self.session = boto3.session.Session()
-        self.client = self.session.client(
-            's3',
-            region_name=os.getenv('DO_SPACES_REGION'),
-            endpoint_url=f"https://nyc3.digitaloceanspaces.com",
-            aws_access_key_id=os.getenv('DO_SPACES_KEY_ID'),
-            aws_secret_access_key=os.getenv('DO_SPACES_SECRET_KEY'),
-            config=Config(s3={'addressing_style': 'virtual'}),
-            # verify=False
-        )
+        self.session = _get_session()
+        self.client = _get_client()
+        self._paginator_list_v2 = self.client.get_paginator('list_objects_v2')
         self.signature_version='s3v4'
         self.use_ssl=True
         self.file_overwrite=True
@@ -25,18 +82,19 @@ class DOSpacesWrapper:
         self.object_parameters={'CacheControl': 'max-age=86400'}
         self.default_acl='public-read-write'
         self.bucket_name = os.getenv('DO_SPACES_BUCKET_NAME')
+        self._verified_buckets = set()
         self.querystring_expire = 3600
         self.querystring_auth = True
         self.max_memory_size = 0 # don't roll over
-        self.retries = {
-            'max_attempts': 5,
-            'mode': 'standard'
-        }
+        self.retries = dict(_RETRIES) # for reference only; applied through the client Config
         self.encryption_scheme = {'ServerSideEncryption': 'AES256'}
 
     def connectToBucket(self, bucketName=None):
         """Connects to a DO Spaces bucket.
 
+        Calling this is optional: every operation already fails with a ClientError if the bucket is missing.
+        Each bucket is only checked once per wrapper, so repeated calls don't cost another request.
+
         Args:
             bucketName: The name of the bucket to connect to (optional).
                 If not provided, uses the bucket name from the class initialization.
@@ -47,29 +105,38 @@ class DOSpacesWrapper:
         if bucketName is None:
             bucketName = self.bucket_name
 
+        if bucketName in self._verified_buckets:
+            return bucketName
+
         try:
             self.client.head_bucket(Bucket=bucketName)
-            print(f"Successfully connected to bucket: {bucketName}")
+            self._verified_buckets.add(bucketName)
+            logger.debug("Successfully connected to bucket: %s", bucketName)
 
             return bucketName
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == '404':
-                print(f"Bucket '{bucketName}' does not exist.")
+                logger.error("Bucket '%s' does not exist.", bucketName)
             else:
-                print(f"An error occurred: {e}")
+                logger.exception("An error occurred while connecting to the bucket")
 
     def listBuckets(self):
         """
         Lists all DigitalOcean Spaces buckets.
+
+        Returns:
+            list: The names of the buckets.
         """
         try:
             response = self.client.list_buckets()
-            print("DigitalOcean Spaces buckets:")
-            for bucket in response['Buckets']:
-                print(f"  {bucket['Name']}")
-        except ClientError as e:
-            print(f"An error occurred: {e}")
+            bucket_names = [bucket['Name'] for bucket in response['Buckets']]
+            logger.debug("DigitalOcean Spaces buckets: %s", bucket_names)
+
+            return bucket_names
+        except ClientError:
+            logger.exception("An error occurred while listing buckets")
+            return []
 
     def createBucket(self):
         """
@@ -77,47 +144,54 @@ class DOSpacesWrapper:
         """
         try:
             self.client.create_bucket(Bucket=self.bucket_name)
-            print(f"Successfully created bucket: {self.bucket_name}")
+            logger.debug("Successfully created bucket: %s", self.bucket_name)
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'BucketAlreadyOwnedByYou':
-                print(f"Bucket '{self.bucket_name}' already exists.")
+                logger.warning("Bucket '%s' already exists.", self.bucket_name)
             else:
-                print(f"An error occurred: {e}")
+                logger.exception("An error occurred while creating the bucket")
 
     def createFolder(self, folderPath):
         """
-        Creates a folder (directory) within the DigitalOcean Spaces bucket.
+        Deprecated: folders don't need to be created.
+
+        Spaces has a flat namespace, so a folder exists as soon as a file is uploaded under its path.
+        No placeholder object is written anymore.
 
         Args:
             folderPath (str): The path of the folder to be created.
+
+        Returns:
+            bool: Always True.
         """
-        try:
-            self.client.put_object(Bucket=self.bucket_name, Key=f"{folderPath}/", Body=b'')
-            print(f"Successfully created folder: {folderPath}")
-        except ClientError as e:
-            print(f"An error occurred while creating the folder: {e}")
+        warnings.warn(
+            "createFolder is deprecated: folders exist implicitly once a file is uploaded under them",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return True
 
     def folderExists(self, folderPath):
         """
         Checks if a folder exists within the DigitalOcean Spaces bucket.
 
+        A folder exists if any object is stored under its path, including a placeholder from older versions of createFolder.
+
         Args:
             folderPath (str): The path of the folder to check.
 
         Returns:
             bool: True if the folder exists, False otherwise.
         """
+        marker = folderPath + '/'
+
         try:
-            self.client.head_object(Bucket=self.bucket_name, Key=f"{folderPath}/")
-            return True
-        except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code == '404':
-                return False
-            else:
-                print(f"An error occurred while checking folder existence: {e}")
-                return False
+            response = self.client.list_objects_v2(Bucket=self.bucket_name, Prefix=marker, MaxKeys=1)
+            return 'Contents' in response
+        except ClientError:
+            logger.exception("An error occurred while checking folder existence")
+            return False
 
     def fileExists(self, filePath):
         """
@@ -137,9 +211,56 @@ class DOSpacesWrapper:
             if error_code == '404':
                 return False
             else:
-                print(f"An error occurred while checking file existence: {e}")
+                logger.exception("An error occurred while checking file existence")
                 return False
 
+    def existsBatch(self, keys):
+        """
+        Checks which of several files exist within the DigitalOcean Spaces bucket.
+
+        The keys are resolved with a listing of their longest common prefix rather than one HEAD per key,
+        so it works best when the keys share a folder. The listing only covers the range between the smallest
+        and largest key; keys with no common prefix fall back to one fileExists call each.
+
+        Args:
+            keys (list): The paths of the files to check.
+
+        Returns:
+            dict: A mapping of each path to True if the file exists, False otherwise.
+        """
+        if len(keys) == 1:
+            return {keys[0]: self.fileExists(keys[0])}
+
+        remaining = set(keys)
+        if not remaining:
+            return {}
+
+        prefix = os.path.commonprefix(keys)
+        if not prefix:
+            # Without a shared prefix the listing could span the whole bucket
+            return {key: self.fileExists(key) for key in keys}
+
+        first_key = min(keys)
+        last_key = max(keys)
+
+        try:
+            # StartAfter is exclusive, so start just before the smallest key to include it
+            operation_parameters = {'Bucket': self.bucket_name, 'Prefix': prefix, 'StartAfter': first_key[:-1], 'PaginationConfig': {'PageSize': 1000}}
+            page_iterator = self._paginator_list_v2.paginate(**operation_parameters)
+
+            for page in page_iterator:
+                listed = page.get('Contents', ())
+                remaining.difference_update(map(_get_key, listed))
+
+                # Keys are listed in order, so stop once every key is found or the listing has passed the largest one
+                if not remaining or (listed and listed[-1]['Key'] > last_key):
+                    break
+        except ClientError:
+            logger.exception("An error occurred while checking file existence")
+            return {key: False for key in keys}
+
+        return {key: key not in remaining for key in keys}
+
     def uploadFile(self, filePath, fileData):
         """
         Uploads a file to the DigitalOcean Spaces bucket.
@@ -150,23 +271,66 @@ class DOSpacesWrapper:
         """
         try:
             self.client.put_object(Bucket=self.bucket_name, Key=filePath, Body=fileData)
-            print(f"Successfully uploaded file: {filePath}")
-        except ClientError as e:
-            print(f"An error occurred while uploading the file: {e}")
+            logger.debug("Successfully uploaded file: %s", filePath)
+        except ClientError:
+            logger.exception("An error occurred while uploading the file")
 
     def updateFile(self, filePath, fileData):
         """
         Updates a file in the DigitalOcean Spaces bucket.
 
+        This re-uploads the whole body; to change only metadata or caching headers, use updateFileMetadata.
+
         Args:
             filePath (str): The path of the file to be updated.
             fileData (bytes or file-like object): The new file data.
         """
         try:
             self.client.put_object(Bucket=self.bucket_name, Key=filePath, Body=fileData)
-            print(f"Successfully updated file: {filePath}")
-        except ClientError as e:
-            print(f"An error occurred while updating the file: {e}")
+            logger.debug("Successfully updated file: %s", filePath)
+        except ClientError:
+            logger.exception("An error occurred while updating the file")
+
+    def updateFileMetadata(self, filePath, metadata=None, cache_control=None, acl=None):
+        """
+        Replaces the metadata of a file in the DigitalOcean Spaces bucket without re-uploading it.
+
+        The file is copied onto itself server-side, so no file data is transferred. A copy with replaced metadata
+        drops every header it isn't given, so the current Content-Type, Content-Disposition, Content-Encoding
+        and Content-Language are read first and carried over. The ACL can't be carried over the same way:
+        unless acl is given, the file falls back to the bucket's default (private) ACL.
+
+        Args:
+            filePath (str): The path of the file to be updated.
+            metadata (dict, optional): The user metadata to set, replacing any existing metadata; pass {} to clear it.
+                Defaults to the file's current metadata.
+            cache_control (str, optional): The Cache-Control header to set. Defaults to the file's current value,
+                or the wrapper's object parameters if it has none.
+            acl (str, optional): The canned ACL to set, e.g. 'public-read'. Defaults to None.
+        """
+        try:
+            head = self.client.head_object(Bucket=self.bucket_name, Key=filePath)
+
+            copy_parameters = {
+                'Bucket': self.bucket_name,
+                'Key': filePath,
+                # Only copy the version that was just inspected, so its headers match what gets carried over
+                'CopySource': {'Bucket': self.bucket_name, 'Key': filePath},
+                'CopySourceIfMatch': head['ETag'],
+                'MetadataDirective': 'REPLACE',
+                'Metadata': metadata if metadata is not None else head.get('Metadata', {}),
+                'CacheControl': cache_control or head.get('CacheControl') or self.object_parameters['CacheControl'],
+            }
+            for header in _PRESERVED_HEADERS:
+                if header in head:
+                    copy_parameters[header] = head[header]
+            if acl is not None:
+                copy_parameters['ACL'] = acl
+
+            self.client.copy_object(**copy_parameters)
+            logger.debug("Successfully updated file metadata: %s", filePath)
+        except ClientError:
+            logger.exception("An error occurred while updating the file metadata")
 
     def deleteFile(self, filePath):
         """
@@ -177,9 +341,9 @@ class DOSpacesWrapper:
         """
         try:
             self.client.delete_object(Bucket=self.bucket_name, Key=filePath)
-            print(f"Successfully deleted file: {filePath}")
-        except ClientError as e:
-            print(f"An error occurred while deleting the file: {e}")
+            logger.debug("Successfully deleted file: %s", filePath)
+        except ClientError:
+            logger.exception("An error occurred while deleting the file")
 
     def deleteFolder(self, folderPath):
         """
@@ -189,23 +353,47 @@ class DOSpacesWrapper:
             folderPath (str): The path of the folder to be deleted.
         """
         try:
-            paginator = self.client.get_paginator('list_objects')
-            operation_parameters = {'Bucket': self.bucket_name, 'Prefix': folderPath}
-            page_iterator = paginator.paginate(**operation_parameters)
+            operation_parameters = {'Bucket': self.bucket_name, 'Prefix': folderPath, 'PaginationConfig': {'PageSize': 1000}}
+            page_iterator = self._paginator_list_v2.paginate(**operation_parameters)
 
+            futures = []
             for page in page_iterator:
-                if 'Contents' in page:
-                    delete_keys = [{'Key': obj['Key']} for obj in page['Contents']]
-                    self.client.delete_objects(Bucket=self.bucket_name, Delete={'Objects': delete_keys})
-
-            print(f"Successfully deleted folder: {folderPath}")
-        except ClientError as e:
-            print(f"An error occurred while deleting the folder: {e}")
+                delete_keys = [{'Key': key} for key in map(_get_key, page.get('Contents', ()))]
+
+                # delete_objects accepts at most 1000 keys, whatever size the page came back as
+                for start in range(0, len(delete_keys), _DELETE_BATCH_SIZE):
+                    batch = delete_keys[start:start + _DELETE_BATCH_SIZE]
+                    futures.append(_executor.submit(self.client.delete_objects, Bucket=self.bucket_name, Delete={'Objects': batch, 'Quiet': True}))
+
+            wait(futures)
+
+            # Check every batch, so one failure doesn't hide the others
+            failed = False
+            for future in futures:
+                batch_error = future.exception()
+                if batch_error is not None:
+                    failed = True
+                    logger.error("A delete batch failed for folder %s", folderPath, exc_info=batch_error)
+                    continue
+
+                # Quiet mode only reports the keys that failed to delete
+                for error in future.result().get('Errors', []):
+                    failed = True
+                    logger.error("Failed to delete %s: %s", error['Key'], error['Message'])
+
+            if failed:
+                logger.error("Folder %s was only partially deleted", folderPath)
+            else:
+                logger.debug("Successfully deleted folder: %s", folderPath)
+        except ClientError:
+            logger.exception("An error occurred while deleting the folder")
 
     def listFolders(self, prefix=''):
         """
         Lists all folders within the DigitalOcean Spaces bucket or a specified prefix.
 
+        Only a single level is listed; use listFoldersRecursive to walk a whole tree in fewer requests.
+
         Args:
             prefix (str, optional): The prefix to filter the folder list. Defaults to ''.
 
@@ -213,18 +401,49 @@ class DOSpacesWrapper:
             list: A list of folder paths.
         """
         try:
-            paginator = self.client.get_paginator('list_objects_v2')
-            operation_parameters = {'Bucket': self.bucket_name, 'Prefix': prefix, 'Delimiter': '/'}
-            page_iterator = paginator.paginate(**operation_parameters)
+            operation_parameters = {'Bucket': self.bucket_name, 'Prefix': prefix, 'Delimiter': '/', 'PaginationConfig': {'PageSize': 1000}}
+            page_iterator = self._paginator_list_v2.paginate(**operation_parameters)
 
             folders = []
             for page in page_iterator:
-                if 'CommonPrefixes' in page:
-                    folders.extend(prefix.replace(prefix, '') for prefix in page['CommonPrefixes'])
+                folders.extend(cp['Prefix'] for cp in page.get('CommonPrefixes', ()))
 
             return folders
-        except ClientError as e:
-            print(f"An error occurred while listing folders: {e}")
+        except ClientError:
+            logger.exception("An error occurred while listing folders")
+            return []
+
+    def listFoldersRecursive(self, prefix=''):
+        """
+        Lists all folders at any depth under a specified prefix in the DigitalOcean Spaces bucket.
+
+        Unlike listFolders, this lists without a delimiter and derives the folders from the object keys,
+        so a whole tree is walked in one flat listing instead of one listing per level.
+
+        Args:
+            prefix (str, optional): The prefix to filter the folder list. Defaults to ''.
+
+        Returns:
+            list: A sorted list of folder paths.
+        """
+        try:
+            operation_parameters = {'Bucket': self.bucket_name, 'Prefix': prefix, 'PaginationConfig': {'PageSize': 1000}}
+            page_iterator = self._paginator_list_v2.paginate(**operation_parameters)
+
+            folders = set()
+            for page in page_iterator:
+                for obj in page.get('Contents', ()):
+                    key = obj['Key']
+
+                    # Every '/' past the prefix closes a folder containing this key
+                    slash = key.find('/', len(prefix))
+                    while slash != -1:
+                        folders.add(key[:slash + 1])
+                        slash = key.find('/', slash + 1)
+
+            return sorted(folders)
+        except ClientError:
+            logger.exception("An error occurred while listing folders")
             return []
 
     def listFolderContents(self, folderPath):
@@ -237,38 +456,42 @@ class DOSpacesWrapper:
         Returns:
             list: A list of file and folder paths within the specified folder.
         """
-        print("Listing folder contents of ", folderPath)
+        logger.debug("Listing folder contents of %s", folderPath)
 
-        # check if the folder exists first
-        if not self.folderExists(folderPath):
-            raise Exception(f"Folder {folderPath} does not exist")
+        marker = folderPath + '/'
 
         try:
-            paginator = self.client.get_paginator('list_objects_v2')
-            operation_parameters = {'Bucket': self.bucket_name, 'Prefix': f'{folderPath}/', 'Delimiter': '/'}
-            page_iterator = paginator.paginate(**operation_parameters)
+            operation_parameters = {'Bucket': self.bucket_name, 'Prefix': marker, 'Delimiter': '/', 'PaginationConfig': {'PageSize': 1000}}
+            page_iterator = self._paginator_list_v2.paginate(**operation_parameters)
 
+            # The listing doubles as the existence check, so no separate HEAD is needed
+            saw_any = False
             contents = []
             for page in page_iterator:
 
                 if 'Contents' in page:
+                    saw_any = True
                     for object in page['Contents']:
                         key = object['Key']
 
-                        if key != f'{folderPath}/':  # Exclude the folder path itself
+                        if key != marker:  # Exclude the folder path itself
                             contents.append(key)
-                
+
                 if 'CommonPrefixes' in page:
+                    saw_any = True
                     for prefix in page['CommonPrefixes']:
 
-                        if prefix['Prefix'] != f'{folderPath}/':   # Exclude the folder path itself
+                        if prefix['Prefix'] != marker:   # Exclude the folder path itself
                             contents.append(prefix['Prefix'])
-
-            return contents
-        except ClientError as e:
-            print(f"An error occurred while listing folder contents: {e}")
+        except ClientError:
+            logger.exception("An error occurred while listing folder contents")
             return []
 
+        if not saw_any:
+            raise Exception(f"Folder {folderPath} does not exist")
+
+        return contents
+
     def streamFileContent(self, filePath, chunkSize=8192):
         """
         Streams the content of a file from the DigitalOcean Spaces bucket.
@@ -281,40 +504,79 @@ class DOSpacesWrapper:
             bytes: The next chunk of the file content.
         """
         try:
-            response = self.client.get_object(Bucket=self.bucket_name, Key=filePath)
-            stream = response['Body']._raw_stream
-            while True:
-                chunk = stream.read(chunkSize)
-                if not chunk:
-                    break
-                yield chunk
-        except ClientError as e:
-            print(f"An error occurred while streaming the file content: {e}")
+            body = self.client.get_object(Bucket=self.bucket_name, Key=filePath)['Body']
+            try:
+                yield from body.iter_chunks(chunk_size=chunkSize)
+            finally:
+                # Hand the connection back to the pool even if the caller stops early
+                body.close()
+        except ClientError:
+            logger.exception("An error occurred while streaming the file content")
 
-    def readFile(self, filePath, chunkSize=8388608):
+    def readFile(self, filePath, chunkSize=8388608, maxWorkers=8):
         """
         Reads data from a file in the DigitalOcean Spaces bucket.
 
+        The file is fetched as concurrent ranged GETs, one per chunk, and the chunks are yielded in file order.
+        Every range is pinned to the ETag seen when the download started, so if the file is overwritten
+        mid-download the read fails with a ClientError (412) instead of mixing old and new content.
+
         Args:
             filePath (str): The path of the file to read from.
             chunkSize (int, optional): The size of each chunk in bytes. Defaults to 8388608 (8MB).
+            maxWorkers (int, optional): The number of ranges downloaded in parallel. Defaults to 8.
 
         Yields:
             bytes: The next chunk of the file content.
+
+        Raises:
+            ClientError: If a range can't be downloaded once reading has started, including when the file changed.
         """
         try:
-            response = self.client.get_object(Bucket=self.bucket_name, Key=filePath)
-            
-            stream = response['Body']._raw_stream
-            
-            while True:
-                chunk = stream.read(chunkSize)
-                
-                if not chunk:
-                    break
-                yield chunk
-        except ClientError as e:
-            print(f"An error occurred while reading from the file: {e}")
+            head = self.client.head_object(Bucket=self.bucket_name, Key=filePath)
+        except ClientError:
+            logger.exception("An error occurred while reading from the file")
+            return
+
+        content_length = head['ContentLength']
+        etag = head['ETag']
+
+        # Range failures are raised rather than logged, so a partial read never looks like a complete file
+        executor = ThreadPoolExecutor(max_workers=maxWorkers)
+        pending = OrderedDict()
+        try:
+            for index, start in enumerate(range(0, content_length, chunkSize)):
+                end = min(start + chunkSize, content_length) - 1
+                pending[index] = executor.submit(self._readRange, filePath, start, end, etag)
+
+                # Keep a bounded window of ranges in flight so memory stays proportional to maxWorkers
+                if len(pending) >= 2 * maxWorkers:
+                    yield pending.popitem(last=False)[1].result()
+
+            while pending:
+                yield pending.popitem(last=False)[1].result()
+        finally:
+            # Don't wait for ranges nobody will read if the caller stopped early or a range failed
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _readRange(self, filePath, start, end, etag):
+        """
+        Downloads an inclusive byte range of a file in the DigitalOcean Spaces bucket.
+
+        Args:
+            filePath (str): The path of the file to read from.
+            start (int): The first byte of the range.
+            end (int): The last byte of the range.
+            etag (str): The ETag the file must still have; the request fails with 412 otherwise.
+
+        Returns:
+            bytes: The content of the requested range.
+        """
+        body = self.client.get_object(Bucket=self.bucket_name, Key=filePath, Range=f"bytes={start}-{end}", IfMatch=etag)['Body']
+        try:
+            return body.read()
+        finally:
+            body.close()
 
     def multipartUpload(self, filePath):
         """
@@ -329,56 +591,43 @@ class DOSpacesWrapper:
         try:
             response = self.client.create_multipart_upload(Bucket=self.bucket_name, Key=filePath)
             return response['UploadId']
-        except ClientError as e:
-            print(f"An error occurred while initiating the multipart upload: {e}")
+        except ClientError:
+            logger.exception("An error occurred while initiating the multipart upload")
             return None
         
     def uploadFileChunked(self, filePath, fileData, chunkSize=8388608):  # 8MB chunks
         """
         Uploads a file to the DigitalOcean Spaces bucket in chunks.
 
+        Files larger than chunkSize are sent as a multipart upload with the chunks uploaded in parallel;
+        smaller files go up in a single request.
+
         Args:
             filePath (str): The path where the file should be uploaded.
             fileData (bytes or file-like object): The file data to be uploaded.
             chunkSize (int, optional): The size of each chunk in bytes. Defaults to 8388608 (8MB).
         """
         try:
-            if hasattr(fileData, 'read'):  # If fileData is a file-like object
-                parts = []
-                part_number = 1
-                upload_id = self.client.create_multipart_upload(Bucket=self.bucket_name, Key=filePath)['UploadId']
-                
-                while True:
-                    chunk = fileData.read(chunkSize)
-                    if not chunk:
-                        break
-                    
-                    part = self.client.upload_part(Body=chunk, Bucket=self.bucket_name, Key=filePath, PartNumber=part_number, UploadId=upload_id)
-                    parts.append({'PartNumber': part_number, 'ETag': part['ETag']})
-                    part_number += 1
-                
-                self.client.complete_multipart_upload(Bucket=self.bucket_name, Key=filePath, MultipartUpload={'Parts': parts}, UploadId=upload_id)
-            else:  # If fileData is bytes
-                self.client.put_object(Bucket=self.bucket_name, Key=filePath, Body=fileData)
-            
-            print(f"Successfully uploaded file: {filePath}")
-        except ClientError as e:
-            print(f"An error occurred while uploading the file: {e}")
+            if not hasattr(fileData, 'read'):  # If fileData is bytes
+                fileData = io.BytesIO(fileData)
 
+            # The transfer manager switches to a concurrent multipart upload past the threshold and aborts it on failure
+            config = TransferConfig(multipart_threshold=chunkSize, multipart_chunksize=chunkSize, max_concurrency=10, use_threads=True)
+            self.client.upload_fileobj(fileData, self.bucket_name, filePath, Config=config)
+
+            logger.debug("Successfully uploaded file: %s", filePath)
+        except ClientError:
+            logger.exception("An error occurred while uploading the file")
+
+    @staticmethod
     def getActualFileNames(filePaths):
         """Extracts filenames from a list of file paths.
 
         Args:
-            file_paths (list): A list of file paths.
+            filePaths (list): A list of file paths.
 
         Returns:
             list: A list containing only the filenames extracted from the paths.
         """
-        filenames = []
-
-        for path in filePaths:
-            # Split the path and extract the last element (filename)
-            filename = path.split("/")[-1]
-            filenames.append(filename)
-            
-        return filenames
\ No newline at end of file
+        # rpartition scans once from the right instead of splitting the whole path
+        return [path.rpartition('/')[2] for path in filePaths]